@@ -1,4 +1,3 @@
-import datetime as dt
 import io
 import json
 import os
@@ -7,7 +6,6 @@ import chardet
 import numpy as np
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 
 from databallpy.data_parsers import Metadata
 from databallpy.data_parsers.event_data_parsers.utils import (
@@ -21,7 +19,6 @@ from databallpy.data_parsers.metrica_metadata_parser import (
 from databallpy.events import DribbleEvent, PassEvent, ShotEvent
 from databallpy.utils.constants import MISSING_INT
 from databallpy.utils.logging import create_logger
-from databallpy.utils.utils import _to_float, _to_int
 
 LOGGER = create_logger(__name__)
 
@@ -33,13 +30,16 @@ metrica_databallpy_map = {
 
 
 def load_metrica_event_data(
-    event_data_loc: str, metadata_loc: str
+    event_data_loc: str, metadata_loc: str, encoding: str | None = "utf-8"
 ) -> tuple[pd.DataFrame, Metadata]:
     """Function to load the metrica event data.
 
     Args:
         event_data_loc (str): location of the event data .json file
         metadata_loc (str): location of the metadata .xml file
+        encoding (str, optional): encoding of the event data .json file. If the
+            file can not be decoded with this encoding, or if it is None, the
+            encoding is detected from the file. Defaults to "utf-8".
 
     Raises:
         TypeError: type error if event_data_loc, or metadata_loc is not a valid input
@@ -78,38 +78,31 @@ def load_metrica_event_data(
     LOGGER.info("Successfully loaded the tracking data channels from the metadata")
     metadata = _update_metadata(td_channels, metadata)
     LOGGER.info("Successfully updated the metadata based on the tracking data channels")
-    event_data = _get_event_data(event_data_loc)
+    event_data = _get_event_data(event_data_loc, encoding=encoding)
     LOGGER.info("Successfully loaded the metrica event data")
 
     # rescale the event locations, metrica data is scaled between 0 and 1.
-    for col in [x for x in event_data.columns if "_x" in x]:
-        event_data[col] = (
-            event_data[col] * metadata.pitch_dimensions[0]
-            - metadata.pitch_dimensions[0] / 2.0
-        )
-    for col in [x for x in event_data.columns if "_y" in x]:
-        event_data[col] = (
-            event_data[col] * metadata.pitch_dimensions[1]
-            - metadata.pitch_dimensions[1] / 2.0
-        )
+    for suffix, pitch_dimension in zip(["_x", "_y"], metadata.pitch_dimensions):
+        cols = [x for x in event_data.columns if x.endswith(suffix)]
+        locations = event_data[cols].to_numpy(dtype=np.float64, copy=True)
+        np.multiply(locations, pitch_dimension, out=locations)
+        np.subtract(locations, pitch_dimension / 2.0, out=locations)
+        event_data[cols] = locations
 
     # add datetime based on frame numbers
-    first_frame = metadata.periods_frames.loc[
-        metadata.periods_frames["period_id"] == 1, "start_frame"
-    ].iloc[0]
-    start_time = metadata.periods_frames.loc[
-        metadata.periods_frames["period_id"] == 1, "start_datetime_ed"
+    first_period = metadata.periods_frames.loc[
+        metadata.periods_frames["period_id"] == 1
     ].iloc[0]
+    first_frame = first_period["start_frame"]
+    start_time = first_period["start_datetime_ed"]
     frame_rate = metadata.frame_rate
-    rel_timedelta = [
-        dt.timedelta(milliseconds=(x - first_frame) / frame_rate * 1000)
-        for x in event_data["td_frame"]
-    ]
+    rel_timedelta = np.round(
+        (event_data["td_frame"].to_numpy() - first_frame) * (1e9 / frame_rate)
+    ).astype("timedelta64[ns]")
 
     # no idea about time zone since we have no real data, so just assume utc
-    event_data["datetime"] = [
-        pd.to_datetime(start_time, utc=True) + x for x in rel_timedelta
-    ]
+    start_datetime = pd.to_datetime(start_time, utc=True)
+    event_data["datetime"] = start_datetime + pd.to_timedelta(rel_timedelta)
 
     event_data = _normalize_playing_direction_events(
         event_data, metadata.home_team_id, metadata.away_team_id
@@ -133,18 +126,29 @@ def load_metrica_open_event_data() -> tuple[pd.DataFrame, Metadata]:
         /master/data/Sample_Game_3/Sample_Game_3_events.json"
 
     LOGGER.info("Downloading Metrica open event data...")
-    raw_ed = requests.get(ed_link).text
+    ed_response = requests.get(ed_link)
+    # the sample data is served as utf-8, skip the encoding detection of requests
+    ed_response.encoding = "utf-8"
+    raw_ed = ed_response.text
     raw_metadata = requests.get(metadata_link).text
     LOGGER.info("Succesfully downloaded the metrica open event data.")
 
     return load_metrica_event_data(raw_ed, raw_metadata)
 
 
-def _get_event_data(event_data_loc: str | io.StringIO) -> pd.DataFrame:
+def _get_event_data(
+    event_data_loc: str | io.StringIO, encoding: str | None = "utf-8"
+) -> pd.DataFrame:
     """Function to load metrica event data
 
     Args:
         event_data_loc (Union[str, io.StringIO]): location of the event data file
+        encoding (str, optional): encoding of the event data file. If the file can
+            not be decoded with this encoding, or if it is None, the encoding is
+            detected from the file. Defaults to "utf-8".
+
+    Raises:
+        ValueError: if the encoding of the event data file can not be detected
 
     Returns:
         pd.DataFrame: event data
@@ -152,106 +156,126 @@ def _get_event_data(event_data_loc: str | io.StringIO) -> pd.DataFrame:
 
     if isinstance(event_data_loc, str) and "{" not in event_data_loc:
         with open(event_data_loc, "rb") as file:
-            encoding = chardet.detect(file.read())["encoding"]
-        with open(event_data_loc, "r", encoding=encoding) as file:
-            lines = file.readlines()
-        raw_data = "".join(str(i) for i in lines)
-        soup = BeautifulSoup(raw_data, "html.parser")
+            raw_data = file.read()
+        decoded_data = None
+        if encoding is not None:
+            try:
+                decoded_data = raw_data.decode(encoding)
+            except UnicodeDecodeError:
+                LOGGER.info(
+                    f"Could not decode {event_data_loc} with encoding {encoding},"
+                    " detecting the encoding instead."
+                )
+        if decoded_data is None:
+            encoding = chardet.detect(raw_data)["encoding"]
+            if encoding is None:
+                message = f"Could not detect the encoding of {event_data_loc}"
+                LOGGER.error(message)
+                raise ValueError(message)
+            decoded_data = raw_data.decode(encoding)
+        events_dict = json.loads(decoded_data.lstrip("\ufeff"))
     else:
-        soup = BeautifulSoup(event_data_loc.strip(), "html.parser")
-    events_dict = json.loads(soup.text)
-
-    result_dict = {
-        "event_id": [],
-        "type_id": [],
-        "databallpy_event": [],
-        "period_id": [],
-        "minutes": [],
-        "seconds": [],
-        "player_id": [],
-        "player_name": [],
-        "team_id": [],
-        "outcome": [],
-        "start_x": [],
-        "start_y": [],
-        "to_player_id": [],
-        "to_player_name": [],
-        "end_x": [],
-        "end_y": [],
-        "td_frame": [],
-        "metrica_event": [],
-    }
+        events_dict = json.loads(event_data_loc)
+
+    raw_events = pd.json_normalize(events_dict["data"])
+    # nested fields that are None in every event are not expanded by json_normalize
+    for col in [
+        "start.x",
+        "start.y",
+        "start.time",
+        "from.id",
+        "from.name",
+        "to.id",
+        "to.name",
+        "end.x",
+        "end.y",
+        "subtypes",
+        "subtypes.name",
+    ]:
+        if col not in raw_events.columns:
+            raw_events[col] = None
+
+    start_time = pd.to_numeric(raw_events["start.time"], errors="coerce")
+    locations = (
+        raw_events[["start.x", "start.y", "end.x", "end.y"]]
+        .apply(pd.to_numeric, errors="coerce")
+        .astype("float64")
+    )
+    metrica_events = raw_events["type.name"].str.lower()
+    databallpy_events = metrica_events.map(metrica_databallpy_map)
+    events = pd.DataFrame(
+        {
+            "event_id": raw_events["index"],
+            "type_id": raw_events["type.id"],
+            "databallpy_event": databallpy_events.where(
+                databallpy_events.notna(), None
+            ),
+            "period_id": raw_events["period"],
+            "minutes": (start_time // 60).fillna(MISSING_INT).astype("int64"),
+            "seconds": start_time % 60,
+            "player_id": _get_player_ids(raw_events["from.id"]),
+            "player_name": raw_events["from.name"].where(
+                raw_events["from.name"].notna(), None
+            ),
+            "team_id": raw_events["team.id"],
+            "outcome": MISSING_INT,
+            "start_x": locations["start.x"],
+            "start_y": locations["start.y"],
+            "to_player_id": _get_player_ids(raw_events["to.id"]),
+            "to_player_name": raw_events["to.name"].where(
+                raw_events["to.name"].notna(), None
+            ),
+            "end_x": locations["end.x"],
+            "end_y": locations["end.y"],
+            "td_frame": raw_events["start.frame"],
+            "metrica_event": metrica_events,
+        },
+        copy=False,
+    )
 
-    check_outcome_last_event = False
-
-    in_possession_events = ["pass", "carry", "recovery", "shot"]
-    out_of_possession_events = ["fault received", "ball out", "ball lost"]
-
-    for event in events_dict["data"]:
-        result_dict["event_id"].append(event["index"])
-        result_dict["type_id"].append(event["type"]["id"])
-        event_name = event["type"]["name"].lower()
-        result_dict["metrica_event"].append(event_name)
-        result_dict["period_id"].append(event["period"])
-        result_dict["minutes"].append(_to_int((event["start"]["time"] // 60)))
-        result_dict["seconds"].append(_to_float(event["start"]["time"] % 60))
-        result_dict["player_id"].append(_to_int(event["from"]["id"][1:]))
-        result_dict["player_name"].append(event["from"]["name"])
-
-        # set outcome for pass or dribble/carry events
-        if check_outcome_last_event:
-            if (
-                event_name in out_of_possession_events
-                and result_dict["team_id"][-1] == event["team"]["id"]
-            ) or (
-                event_name in in_possession_events
-                and result_dict["team_id"][-1] != event["team"]["id"]
-            ):
-                result_dict["outcome"][-1] = 0
-            else:
-                result_dict["outcome"][-1] = 1
-            check_outcome_last_event = False
-
-        # set outcome for shot events
-        if event_name == "shot":
-            if isinstance(event["subtypes"], list):
-                outcome = 0
-                for sub in event["subtypes"]:
-                    if sub["name"] == "GOAL":
-                        outcome = 1
-                        break
-            else:
-                subtypes = event["subtypes"]
-                outcome = 1 if subtypes["name"] == "GOAL" else 0
-            result_dict["outcome"].append(outcome)
-        else:
-            result_dict["outcome"].append(MISSING_INT)
-
-        # Check if outcome needs to be set based on next event
-        if event_name in ["pass", "carry"]:
-            check_outcome_last_event = True
-
-        result_dict["team_id"].append(event["team"]["id"])
-        result_dict["start_x"].append(_to_float(event["start"]["x"]))
-        result_dict["start_y"].append(_to_float(event["start"]["y"]))
-        if event["to"] is not None:
-            result_dict["to_player_id"].append(_to_int(event["to"]["id"][1:]))
-            result_dict["to_player_name"].append(event["to"]["name"])
-        else:
-            result_dict["to_player_id"].append(MISSING_INT)
-            result_dict["to_player_name"].append(None)
-        result_dict["end_x"].append(_to_float(event["end"]["x"]))
-        result_dict["end_y"].append(_to_float(event["end"]["y"]))
-        result_dict["td_frame"].append(event["start"]["frame"])
-
-    result_dict["databallpy_event"] = [None] * len(result_dict["event_id"])
-    events = pd.DataFrame(result_dict)
-    events["databallpy_event"] = (
-        events["metrica_event"].map(metrica_databallpy_map).replace([np.nan], [None])
+    # set outcome for pass or dribble/carry events based on the next event
+    next_event = events["metrica_event"].shift(-1)
+    next_team_id = events["team_id"].shift(-1)
+    lost_possession = (
+        next_event.isin(["fault received", "ball out", "ball lost"])
+        & (next_team_id == events["team_id"])
+    ) | (
+        next_event.isin(["pass", "carry", "recovery", "shot"])
+        & (next_team_id != events["team_id"])
     )
+    pass_carry_mask = events["metrica_event"].isin(["pass", "carry"]) & (
+        next_event.notna()
+    )
+    events.loc[pass_carry_mask, "outcome"] = np.where(lost_possession, 0, 1)[
+        pass_carry_mask
+    ]
+
+    # set outcome for shot events, subtypes are either a list of dicts, or a
+    # single dict that is expanded into the subtypes.name column by json_normalize
+    subtypes = raw_events["subtypes"].explode().astype(object)
+    subtypes = subtypes.where(subtypes.notna(), None)
+    is_goal = (subtypes.str.get("name") == "GOAL").groupby(level=0).any() | (
+        raw_events["subtypes.name"] == "GOAL"
+    )
+    shot_mask = events["metrica_event"] == "shot"
+    events.loc[shot_mask, "outcome"] = is_goal[shot_mask].astype("int64")
     return events
 
 
+def _get_player_ids(metrica_ids: pd.Series) -> pd.Series:
+    """Function to get the integer player ids from the metrica player ids, which
+    are prefixed with a "P".
+
+    Args:
+        metrica_ids (pd.Series): metrica player ids, e.g. "P3578"
+
+    Returns:
+        pd.Series: integer player ids, MISSING_INT if the id is not available
+    """
+    player_ids = pd.to_numeric(metrica_ids.astype("string").str[1:], errors="coerce")
+    return player_ids.fillna(MISSING_INT).astype("int64")
+
+
 def _get_databallpy_events(
     event_data: pd.DataFrame, pitch_dimensions: tuple[float, float], home_team_id: int
 ) -> dict:
@@ -265,41 +289,22 @@ def _get_databallpy_events(
     Returns:
         dict: dictionary with the databallpy events
     """
-    shot_events = {}
-    pass_events = {}
-    dribble_events = {}
-
     shot_mask = event_data["databallpy_event"] == "shot"
     shot_events = {
-        shot.event_id: shot
-        for shot in event_data[shot_mask].apply(
-            _get_shot_event,
-            pitch_dimensions=pitch_dimensions,
-            home_team_id=home_team_id,
-            axis=1,
-        )
+        row.event_id: _get_shot_event(row, pitch_dimensions, home_team_id)
+        for row in event_data[shot_mask].itertuples(index=False)
     }
 
-    pass_maks = event_data["databallpy_event"] == "pass"
+    pass_mask = event_data["databallpy_event"] == "pass"
     pass_events = {
-        pass_.event_id: pass_
-        for pass_ in event_data[pass_maks].apply(
-            _get_pass_event,
-            pitch_dimensions=pitch_dimensions,
-            home_team_id=home_team_id,
-            axis=1,
-        )
+        row.event_id: _get_pass_event(row, pitch_dimensions, home_team_id)
+        for row in event_data[pass_mask].itertuples(index=False)
     }
 
     dribble_mask = event_data["databallpy_event"] == "dribble"
     dribble_events = {
-        dribble.event_id: dribble
-        for dribble in event_data[dribble_mask].apply(
-            _get_dribble_event,
-            pitch_dimensions=pitch_dimensions,
-            home_team_id=home_team_id,
-            axis=1,
-        )
+        row.event_id: _get_dribble_event(row, pitch_dimensions, home_team_id)
+        for row in event_data[dribble_mask].itertuples(index=False)
     }
 
     databallpy_events = {
@@ -311,13 +316,14 @@ def _get_databallpy_events(
 
 
 def _get_shot_event(
-    row: pd.Series, pitch_dimensions: tuple[float, float], home_team_id: int
+    row: tuple, pitch_dimensions: tuple[float, float], home_team_id: int
 ) -> ShotEvent:
     """Function to return a ShotEvent object from a row of the metrica
       event data
 
     Args:
-        row (pd.Series): row of the metrica event data with a shot event
+        row (tuple): named tuple of a row of the metrica event data with a
+            shot event
         pitch_dimensions (tuple): dimensions of the pitch
         home_team_id (int): id of the home team
 
@@ -349,13 +355,14 @@ def _get_shot_event(
 
 
 def _get_pass_event(
-    row: pd.Series, pitch_dimensions: tuple[float, float], home_team_id: int
+    row: tuple, pitch_dimensions: tuple[float, float], home_team_id: int
 ) -> PassEvent:
     """Function to return a PassEvent object from a row of the metrica
      event data.
 
     Args:
-        row (pd.Series): row of the metrica event data with a pass event
+        row (tuple): named tuple of a row of the metrica event data with a
+            pass event
         pitch_dimensions (tuple): dimensions of the pitch
         home_team_id (int): id of the home team
 
@@ -386,13 +393,14 @@ def _get_pass_event(
 
 
 def _get_dribble_event(
-    row: pd.Series, pitch_dimensions: tuple[float, float], home_team_id: int
+    row: tuple, pitch_dimensions: tuple[float, float], home_team_id: int
 ) -> DribbleEvent:
     """Function to return a DribbleEvent object from a row of the metrica
      event data.
 
     Args:
-        row (pd.Series): row of the metrica event data with a dribble event
+        row (tuple): named tuple of a row of the metrica event data with a
+            dribble event
         pitch_dimensions (tuple): dimensions of the pitch
         home_team_id (int): id of the home team
 
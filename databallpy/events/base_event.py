@@ -12,7 +12,7 @@ OPEN_PLAY_XT = np.load(f"{path}/open_play_xT.npy")
 THROW_IN_XT = np.load(f"{path}/throw_in_xT.npy")
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseOnBallEvent:
     """This is the base on ball event class from which the specific event classes are
     inherited. It containts all the basic information that is available for every event.
@@ -173,6 +173,14 @@ class BaseOnBallEvent:
         if not isinstance(self._xt, (float, np.floating, int, np.integer)):
             raise TypeError(f"xT should be float, not {type(self._xt)}")
 
+    def __setstate__(self, state: dict | tuple):
+        # events pickled before the event classes used slots have a dict as state,
+        # events pickled with slots have a (None, slots_state) tuple as state.
+        if isinstance(state, tuple):
+            state = state[1]
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, BaseOnBallEvent):
             return False
@@ -6,7 +6,7 @@ import pandas as pd
 from databallpy.events.base_event import BaseOnBallEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class DribbleEvent(BaseOnBallEvent):
     """Class for dribble events
 
@@ -51,29 +51,36 @@ class DribbleEvent(BaseOnBallEvent):
     has_opponent: bool = False
 
     def __post_init__(self):
-        super().__post_init__()
+        BaseOnBallEvent.__post_init__(self)
         self._check_datatypes()
         _ = self._xt
 
     def __eq__(self, other):
-        if not isinstance(other, DribbleEvent):
-            return False
-        else:
-            result = [
-                super().__eq__(other),
-                self.player_id == other.player_id,
-                self.related_event_id == other.related_event_id,
+        return (
+            isinstance(other, DribbleEvent)
+            and BaseOnBallEvent.__eq__(self, other)
+            and (
+                self.player_id,
+                self.related_event_id,
+                self.outcome,
+                self.has_opponent,
+            )
+            == (
+                other.player_id,
+                other.related_event_id,
+                other.outcome,
+                other.has_opponent,
+            )
+            and (
                 self.duel_type == other.duel_type
                 if not pd.isnull(self.duel_type)
-                else pd.isnull(other.duel_type),
-                self.outcome == other.outcome,
-                self.has_opponent == other.has_opponent,
-            ]
-            return all(result)
+                else pd.isnull(other.duel_type)
+            )
+        )
 
     @property
     def df_attributes(self) -> list[str]:
-        base_attributes = super().base_df_attributes
+        base_attributes = self.base_df_attributes
         return base_attributes + [
             "player_id",
             "related_event_id",
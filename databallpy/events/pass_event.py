@@ -10,7 +10,7 @@ from databallpy.features.pressure import get_pressure_on_player
 from databallpy.utils.constants import MISSING_INT
 
 
-@dataclass
+@dataclass(slots=True)
 class PassEvent(BaseOnBallEvent):
     """This is the pass event class. It contains all the information that is available
     for a pass event.
@@ -162,7 +162,7 @@ class PassEvent(BaseOnBallEvent):
         if not isinstance(other, PassEvent):
             return False
         result = [
-            super().__eq__(other),
+            BaseOnBallEvent.__eq__(self, other),
             self.team_id == other.team_id,
             self.outcome == other.outcome,
             self.player_id == other.player_id,
@@ -203,7 +203,7 @@ class PassEvent(BaseOnBallEvent):
         return all(result)
 
     def __post_init__(self):
-        super().__post_init__()
+        BaseOnBallEvent.__post_init__(self)
 
         if not isinstance(self.outcome, (str, type(None))):
             raise TypeError(f"outcome should be str, not {type(self.outcome)}")
@@ -301,7 +301,7 @@ class PassEvent(BaseOnBallEvent):
 
     @property
     def df_attributes(self) -> list[str]:
-        base_attributes = super().base_df_attributes
+        base_attributes = self.base_df_attributes
         return base_attributes + [
             "outcome",
             "player_id",
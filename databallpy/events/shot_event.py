@@ -14,7 +14,7 @@ from databallpy.models.utils import scale_and_predict_logreg
 from databallpy.utils.constants import MISSING_INT
 
 
-@dataclass
+@dataclass(slots=True)
 class ShotEvent(BaseOnBallEvent):
     """Class for shot events, inherits from BaseEvent. Saves all information from a
     shot from the event data, and adds information about the shot using the tracking
@@ -114,7 +114,7 @@ class ShotEvent(BaseOnBallEvent):
     set_piece: str = "no_set_piece"
 
     def __post_init__(self):
-        super().__post_init__()
+        BaseOnBallEvent.__post_init__(self)
         self._check_datatypes()
         if self.type_of_play in ["penalty", "free_kick"]:
             self.set_piece = self.type_of_play
@@ -127,7 +127,7 @@ class ShotEvent(BaseOnBallEvent):
 
     @property
     def df_attributes(self) -> list[str]:
-        base_attributes = super().base_df_attributes
+        base_attributes = self.base_df_attributes
         return base_attributes + [
             "player_id",
             "shot_outcome",
@@ -329,7 +329,7 @@ class ShotEvent(BaseOnBallEvent):
         if not isinstance(other, ShotEvent):
             return False
         result = [
-            super().__eq__(other),
+            BaseOnBallEvent.__eq__(self, other),
             self.player_id == other.player_id,
             self.shot_outcome == other.shot_outcome,
             round(self.y_target, 4) == round(other.y_target, 4)
@@ -1,3 +1,6 @@
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import Mock, patch
 
@@ -6,9 +9,11 @@ import pandas as pd
 from databallpy.data_parsers.event_data_parsers.metrica_event_data_parser import (
     _get_databallpy_events,
     _get_event_data,
+    _get_player_ids,
     load_metrica_event_data,
     load_metrica_open_event_data,
 )
+from databallpy.utils.constants import MISSING_INT
 from tests.expected_outcomes import (
     DRIBBLE_EVENTS_METRICA,
     ED_METRICA,
@@ -32,6 +37,9 @@ class TestMetricaEventDataParser(unittest.TestCase):
         assert dbpe["pass_events"] == PASS_EVENTS_METRICA
         assert dbpe["dribble_events"] == DRIBBLE_EVENTS_METRICA
 
+        ed, _, _ = load_metrica_event_data(self.ed_loc, self.md_loc, encoding=None)
+        pd.testing.assert_frame_equal(ed, ED_METRICA)
+
         with self.assertRaises(TypeError):
             load_metrica_event_data(22, self.md_loc)
 
@@ -52,6 +60,41 @@ class TestMetricaEventDataParser(unittest.TestCase):
         ed = _get_event_data(self.ed_loc)
         pd.testing.assert_frame_equal(ed, expected_event_data)
 
+        ed = _get_event_data(self.ed_loc, encoding=None)
+        pd.testing.assert_frame_equal(ed, expected_event_data)
+
+    def test_get_event_data_encoding(self):
+        expected_event_data = _get_event_data(self.ed_loc)
+        with open(self.ed_loc, "rb") as file:
+            raw_data = file.read()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # utf-8 file with a byte order mark
+            bom_loc = os.path.join(tmp_dir, "bom.json")
+            with open(bom_loc, "wb") as file:
+                file.write(b"\xef\xbb\xbf" + raw_data)
+            pd.testing.assert_frame_equal(_get_event_data(bom_loc), expected_event_data)
+
+            # latin-1 file with the only non ascii characters after the first 64 kB
+            events_dict = json.loads(raw_data)
+            events_dict = {"padding": "a" * 70000, **events_dict}
+            events_dict["data"][-1]["from"]["name"] = "José Müller"
+            latin_loc = os.path.join(tmp_dir, "latin.json")
+            with open(latin_loc, "wb") as file:
+                file.write(
+                    json.dumps(events_dict, ensure_ascii=False).encode("latin-1")
+                )
+            ed = _get_event_data(latin_loc)
+            assert ed["player_name"].iloc[-1] == "José Müller"
+
+            with patch("chardet.detect", return_value={"encoding": None}):
+                with self.assertRaises(ValueError):
+                    _get_event_data(latin_loc)
+
+    def test_get_player_ids(self):
+        res = _get_player_ids(pd.Series(["P3578", None, "P12"]))
+        pd.testing.assert_series_equal(res, pd.Series([3578, MISSING_INT, 12]))
+
     @patch(
         "requests.get",
         side_effect=[Mock(text=ED_METRICA_RAW), Mock(text=MD_METRICA_RAW)],
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import numpy as np
@@ -98,6 +99,17 @@ class TestBaseOnBallEvent(unittest.TestCase):
             _xt=0.02,
         )
 
+    def test_base_on_ball_event_pickle(self):
+        assert pickle.loads(pickle.dumps(self.base_event)) == self.base_event
+
+        # events pickled before the event classes used slots
+        state = {
+            name: getattr(self.base_event, name) for name in BaseOnBallEvent.__slots__
+        }
+        event = BaseOnBallEvent.__new__(BaseOnBallEvent)
+        event.__setstate__(state)
+        assert event == self.base_event
+
     def test_base_on_ball_event_post_init(self):
         # event_id
         with self.assertRaises(TypeError):